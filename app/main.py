@@ -16,7 +16,7 @@ from app.parsers.excel_parser import parse_forecast_file
 
 # Import services
 from app.services.logger import get_logger, LogEventType
-from app.services.config import get_config
+from app.services.config import get_config, SQL_QUERY_TYPES
 from app.services.order_tracker import get_order_tracker
 from app.services.sql_service import get_sql_service
 from app.services.xml_generator import (
@@ -111,6 +111,7 @@ def sql_executor():
     return render_template('sql.html',
                          sql_queries=config_service.config.sql_queries,
                          configured_count=config_service.get_configured_sql_count(),
+                         query_type_count=len(SQL_QUERY_TYPES),
                          connected=sql_service.is_connected(),
                          db_configured=config_service.is_db_configured(),
                          db_credentials=db_creds,
@@ -135,7 +136,8 @@ def get_config_api():
         "forecast_folder": config_service.config.forecast_folder,
         "po_folder": config_service.config.po_folder,
         "scheduler_hour": config_service.config.scheduler_hour,
-        "scheduler_minute": config_service.config.scheduler_minute
+        "scheduler_minute": config_service.config.scheduler_minute,
+        "sql_log_every": config_service.config.sql_log_every
     })
 
 
@@ -178,6 +180,13 @@ def save_config_api():
     if not config_service.set_scheduler_time(hour, minute):
         errors.append("Invalid scheduler time")
 
+    # Set SQL query log sampling (left unchanged if not sent)
+    if 'sql_log_every' in data:
+        if config_service.set_sql_log_every(data['sql_log_every']):
+            logger.sql_log_every = config_service.config.sql_log_every
+        else:
+            errors.append("Invalid SQL log setting")
+
     if errors:
         return jsonify({"success": False, "errors": errors}), 400
 
@@ -665,6 +674,7 @@ def save_sql_queries():
 
     try:
         config_service.set_all_sql_queries(data)
+        get_sql_service().reload_queries()
         logger.log_user_action("SQL queries updated", f"{config_service.get_configured_sql_count()} queries configured")
         return jsonify({"success": True})
     except Exception as e:
@@ -717,6 +727,14 @@ def test_sql_query():
                 {"movement_id": "MOV-001", "job_number": "7771759", "quantity": 5000, "status": "ACTIVE",
                  "created_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
             ]
+        elif query_type == 'movements_total':
+            mock_data = [
+                {"total": 5000}
+            ]
+        elif query_type in ('fg_total', 'wip_total', 'sw_fg_total'):
+            mock_data = [
+                {"total": 19500}
+            ]
 
         execution_time = round(time.time() - start, 3)
 
@@ -18,9 +18,14 @@ SQL_QUERY_TYPES = [
     'fg_inventory',      # Finished Goods inventory lookup
     'wip_inventory',     # Work In Progress inventory lookup
     'open_jobs',         # Open production jobs lookup
-    'item_mapping',      # Part number to Item code mapping
+    'item_mapping',      # Part number to Item code mapping (one row - use TOP 1 / FETCH FIRST 1 ROWS ONLY)
     'movements',         # Active movements/allocations lookup
     'sw_fg',             # Sherwin Williams FG inventory lookup
+    'movements_total',   # Total active movement quantity for a job (aggregate)
+    'fg_total',          # Total FG quantity for a part (aggregate)
+    'wip_total',         # Total WIP quantity for a part (aggregate)
+    'sw_fg_total',       # Total Sherwin Williams FG quantity for a part (aggregate)
+    'create_movement',   # Insert a movement record (bulk, one row per movement)
 ]
 
 
@@ -33,6 +38,11 @@ class SQLQueries:
     item_mapping: Optional[str] = None       # Query to map part number to item code
     movements: Optional[str] = None          # Query to get active movements for a job
     sw_fg: Optional[str] = None              # Query to get Sherwin Williams FG inventory
+    movements_total: Optional[str] = None    # Query to sum active movement quantity for a job
+    fg_total: Optional[str] = None           # Query to sum FG inventory for a part
+    wip_total: Optional[str] = None          # Query to sum WIP inventory for a part
+    sw_fg_total: Optional[str] = None        # Query to sum Sherwin Williams FG inventory for a part
+    create_movement: Optional[str] = None    # Statement to insert a movement record
 
     def to_dict(self) -> dict:
         return asdict(self)
@@ -45,7 +55,12 @@ class SQLQueries:
             open_jobs=data.get('open_jobs'),
             item_mapping=data.get('item_mapping'),
             movements=data.get('movements'),
-            sw_fg=data.get('sw_fg')
+            sw_fg=data.get('sw_fg'),
+            movements_total=data.get('movements_total'),
+            fg_total=data.get('fg_total'),
+            wip_total=data.get('wip_total'),
+            sw_fg_total=data.get('sw_fg_total'),
+            create_movement=data.get('create_movement')
         )
 
     def get_query(self, query_type: str) -> Optional[str]:
@@ -68,6 +83,7 @@ class AppConfig:
     xml_output_folder: Optional[str] = None  # Path to save generated XML files
     scheduler_hour: int = 7  # Hour to run daily processing (24h format)
     scheduler_minute: int = 0  # Minute to run daily processing
+    sql_log_every: int = 1  # Log 1 in N successful SQL queries (0 = errors only)
     last_forecast_file: Optional[str] = None  # Last loaded forecast filename
     last_forecast_modified: Optional[str] = None  # Last modified timestamp of forecast file
     sql_queries: SQLQueries = field(default_factory=SQLQueries)  # SQL query templates
@@ -88,6 +104,7 @@ class AppConfig:
             xml_output_folder=data.get('xml_output_folder'),
             scheduler_hour=data.get('scheduler_hour', 7),
             scheduler_minute=data.get('scheduler_minute', 0),
+            sql_log_every=data.get('sql_log_every', 1),
             last_forecast_file=data.get('last_forecast_file'),
             last_forecast_modified=data.get('last_forecast_modified'),
             sql_queries=SQLQueries.from_dict(sql_data) if sql_data else SQLQueries(),
@@ -177,6 +194,14 @@ class ConfigService:
         self._save_config()
         return True
 
+    def set_sql_log_every(self, every: int) -> bool:
+        """Set how many successful SQL queries are logged (1 in N, 0 = errors only)"""
+        if not isinstance(every, int) or isinstance(every, bool) or every < 0:
+            return False
+        self._config.sql_log_every = every
+        self._save_config()
+        return True
+
     def get_forecast_files(self) -> list:
         """Get list of .xlsx files in forecast folder"""
         if not self._config.forecast_folder:
@@ -297,6 +322,8 @@ class ConfigService:
                 - username: Database username (optional for Windows auth)
                 - password: Database password (optional for Windows auth)
                 - trusted_connection: Use Windows authentication (bool)
+                - pool_min_size / pool_max_size: Pooled connections opened up front / at most (optional)
+                - pool_timeout: Seconds to wait for a free pooled connection (optional)
 
         Returns:
             True if credentials were saved
@@ -56,10 +56,12 @@ class LogEntry:
 class ActivityLogger:
     """File-based activity logger for compliance and audit trail"""
 
-    def __init__(self, log_dir: str = "outputs/logs"):
+    def __init__(self, log_dir: str = "outputs/logs", sql_log_every: int = 1):
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self._entries_cache: List[LogEntry] = []  # In-memory cache for current session
+        self.sql_log_every = sql_log_every  # Log 1 in N successful SQL queries (0 disables, errors are always logged)
+        self._sql_query_count = 0
 
     def _get_log_file(self, date: Optional[datetime] = None) -> Path:
         """Get log file path for a specific date"""
@@ -132,6 +134,13 @@ class ActivityLogger:
             part_number=part_number
         ))
 
+    def should_log_sql_query(self) -> bool:
+        """Check whether the next successful SQL query should be logged"""
+        if self.sql_log_every <= 0:
+            return False
+        self._sql_query_count += 1
+        return self._sql_query_count % self.sql_log_every == 0
+
     def log_sql_query(self, query: str, execution_time: float, row_count: int, error: str = None):
         """Log SQL query execution"""
         status = f"{row_count} rows in {execution_time:.2f}s" if not error else f"Error: {error}"
@@ -230,5 +239,6 @@ def get_logger() -> ActivityLogger:
     """Get the global logger instance"""
     global _logger
     if _logger is None:
-        _logger = ActivityLogger()
+        from app.services.config import get_config
+        _logger = ActivityLogger(sql_log_every=get_config().config.sql_log_every)
     return _logger
@@ -5,19 +5,91 @@ Provides functions to execute configured SQL queries against the ERP database.
 Supports ODBC connections via pyodbc for SQL Server, Oracle, etc.
 """
 
+import json
+import queue
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing, contextmanager
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Tuple, Any
+from itertools import repeat
+from operator import attrgetter, itemgetter, sub
+from typing import Optional, List, Dict, Tuple, Any, Callable, Iterator, Sequence
 from datetime import datetime
 
 from app.services.config import get_config, SQL_QUERY_TYPES
 from app.services.logger import get_logger
 
-# Try to import pyodbc for database connectivity
+# pyodbc is imported on first use (see _ensure_pyodbc) so pages that never
+# connect don't pay for loading it and probing the ODBC driver manager
+pyodbc = None
+PYODBC_AVAILABLE: Optional[bool] = None  # None until the import has been tried
+
+
+def _ensure_pyodbc() -> bool:
+    """Import pyodbc for database connectivity if not done yet, returning whether it's available"""
+    global pyodbc, PYODBC_AVAILABLE
+    if PYODBC_AVAILABLE is None:
+        try:
+            import pyodbc as _pyodbc
+        except ImportError:
+            PYODBC_AVAILABLE = False
+        else:
+            # SQLService pools its own connections - keep the driver manager's pool out of it
+            _pyodbc.pooling = False
+            pyodbc = _pyodbc
+            PYODBC_AVAILABLE = True
+    return PYODBC_AVAILABLE
+
+
+# Use orjson for FOR JSON result sets when installed (optional, faster than json)
 try:
-    import pyodbc
-    PYODBC_AVAILABLE = True
+    import orjson
+    _json_loads = orjson.loads
 except ImportError:
-    PYODBC_AVAILABLE = False
+    _json_loads = json.loads
+
+# :param_name placeholders (skips :: casts and colons inside words/times, e.g. '12:30')
+_PARAM_RE = re.compile(r'(?<![:\w]):([A-Za-z_]\w*)')
+
+# Column name SQL Server gives the result of a FOR JSON query
+_FOR_JSON_COLUMN = 'JSON_F52E2B61-18A1-11d1-B105-00805F49916B'
+
+# Seconds a query's results may be reused before hitting the database again
+# (query types not listed here are never cached)
+RESULT_CACHE_TTL = {
+    'item_mapping': 300,
+    'fg_inventory': 15,
+    'wip_inventory': 15,
+    'sw_fg': 15,
+    'open_jobs': 15,
+    'movements': 5,
+    'movements_total': 5,
+    'fg_total': 15,
+    'wip_total': 15,
+    'sw_fg_total': 15,
+}
+RESULT_CACHE_MAX_ENTRIES = 1024
+
+# SQL Server accepts at most 2100 parameters in one batch
+MAX_BATCH_PARAMS = 2100
+
+# Servers (SQL_DBMS_NAME prefix) that run several ;-separated statements in
+# one execute(); others (e.g. Oracle) get the statements one at a time
+BATCH_DBMS_NAMES = ('Microsoft SQL Server',)
+
+# Rows pulled from the driver per fetchmany() call
+FETCH_ARRAYSIZE = 500
+
+# Open jobs fetched per chunk when streaming them (see iter_open_jobs)
+STREAM_CHUNK_SIZE = 100
+
+# Connection pool defaults (override with pool_min_size / pool_max_size /
+# pool_timeout in the database credentials)
+POOL_MIN_SIZE = 1  # Connections opened up front by connect()
+POOL_MAX_SIZE = 4  # Connections open at once (one per concurrent query)
+POOL_TIMEOUT = 30  # Seconds to wait for a free connection when all are busy
 
 
 @dataclass
@@ -48,7 +120,7 @@ class MovementResult:
     job_number: str
     quantity: int
     status: str
-    created_date: datetime
+    created_date: Optional[datetime]  # None if the movements query doesn't return it
 
 
 @dataclass
@@ -59,16 +131,177 @@ class ItemMapping:
     description: Optional[str] = None
 
 
+# Movement statuses that count against a job's remaining capacity
+_ACTIVE_STATUSES = frozenset(('ACTIVE', 'PENDING', 'OPEN'))
+
+# Optional aggregate query that can stand in for each inventory source's rows
+_INVENTORY_TOTAL_QUERIES = {
+    'fg_inventory': 'fg_total',
+    'wip_inventory': 'wip_total',
+    'sw_fg': 'sw_fg_total',
+}
+
+_get_quantity = attrgetter('quantity')
+_get_job_number = attrgetter('job_number')
+_get_quantity_remaining = attrgetter('quantity_remaining')
+
+
+def _total_quantity(rows: List[InventoryResult]) -> int:
+    """Sum the quantity column of inventory rows"""
+    return sum(map(_get_quantity, rows))
+
+
+# ============== ROW FACTORIES ==============
+# Build result objects straight from driver rows. A row factory is called
+# once per result set with col_index (column name -> position) and returns
+# the function that builds each row, so columns are resolved only once.
+
+RowBuilder = Callable[[Any], Any]
+RowFactory = Callable[[Dict[str, int]], RowBuilder]
+
+# (column, default if the query didn't return it), in dataclass field order
+_INVENTORY_COLUMNS = (('item_code', ''), ('job_number', None), ('quantity', 0), ('location', None))
+_JOB_COLUMNS = (
+    ('job_number', ''), ('item_code', ''), ('part_number', ''), ('quantity_ordered', 0),
+    ('quantity_produced', 0), ('quantity_remaining', 0), ('status', 'UNKNOWN')
+)
+
+
+def _column_reader(col_index: Dict[str, int], columns: Tuple[Tuple[str, Any], ...]) -> Callable[[Any], Sequence]:
+    """
+    Resolve (column, default) pairs to row positions once per result set.
+
+    Returns a function reading those columns from a row in order, using
+    the default for any column the query didn't return.
+    """
+    positions = [(col_index.get(name), default) for name, default in columns]
+    if len(positions) > 1 and all(i is not None for i, _ in positions):
+        # Every column present (the usual case) - read them in one C-level call
+        return itemgetter(*(i for i, _ in positions))
+    return lambda row: [default if i is None else row[i] for i, default in positions]
+
+
+def _inventory_row(col_index: Dict[str, int]) -> RowBuilder:
+    """Row factory for inventory queries"""
+    read = _column_reader(col_index, _INVENTORY_COLUMNS)
+    return lambda row: InventoryResult(*read(row))
+
+
+def _job_row(col_index: Dict[str, int]) -> RowBuilder:
+    """Row factory for the open jobs query"""
+    read = _column_reader(col_index, _JOB_COLUMNS)
+    return lambda row: JobResult(*read(row))
+
+
+def _total_row(col_index: Dict[str, int]) -> RowBuilder:
+    """Row factory reading the total column of an aggregate query"""
+    i = col_index.get('total')
+    if i is None:
+        return lambda row: 0
+    return lambda row: int(row[i] or 0)
+
+
+def _item_mapping_row_factory(part_number: str) -> RowFactory:
+    """Row factory for the item mapping query (defaults part_number to the one looked up)"""
+    columns = (('part_number', part_number), ('item_code', ''), ('description', None))
+
+    def factory(col_index: Dict[str, int]) -> RowBuilder:
+        read = _column_reader(col_index, columns)
+        return lambda row: ItemMapping(*read(row))
+    return factory
+
+
+def _movement_row_factory(job_number: str) -> RowFactory:
+    """Row factory for the movements query (defaults job_number to the one looked up)"""
+    columns = (
+        ('movement_id', ''), ('job_number', job_number), ('quantity', 0),
+        ('status', 'UNKNOWN'), ('created_date', None)
+    )
+
+    def factory(col_index: Dict[str, int]) -> RowBuilder:
+        read = _column_reader(col_index, columns)
+        return lambda row: MovementResult(*read(row))
+    return factory
+
+
 class SQLExecutionError(Exception):
     """Raised when SQL execution fails"""
     pass
 
 
+class SQLPoolBusyError(SQLExecutionError):
+    """Raised instead of waiting for a pooled connection while this thread already holds one"""
+    pass
+
+
 class SQLNotConfiguredError(Exception):
     """Raised when required SQL query is not configured"""
     pass
 
 
+class _LiveBackend:
+    """Runs queries against the connected database (see SQLService._backend)"""
+
+    connected = True
+
+    def __init__(self, service: 'SQLService'):
+        self.fetch = service._cached_execute
+        self.fetch_many = service._cached_execute_many
+
+
+class _MockBackend:
+    """Returns mock data while no database is connected (see SQLService._backend)"""
+
+    connected = False
+
+    def fetch(self, query_type: str, params: dict, row_factory: RowFactory = None, single: bool = False) -> List:
+        """Mock results for one query (empty for query types without mock data)"""
+        mock = getattr(self, f'_mock_{query_type}', None)
+        return mock(**params) if mock else []
+
+    def fetch_many(self, queries: List[Tuple[str, dict, Optional[RowFactory]]]) -> List[List]:
+        """Mock results for several queries"""
+        return [self.fetch(query_type, params) for query_type, params, _ in queries]
+
+    def _mock_fg_inventory(self, part_number: str, site: str) -> List[InventoryResult]:
+        """Return mock FG inventory data"""
+        # Return empty to simulate no inventory (forces job creation logic)
+        return []
+
+    def _mock_wip_inventory(self, part_number: str, site: str) -> List[InventoryResult]:
+        """Return mock WIP inventory data"""
+        return []
+
+    def _mock_sw_fg(self, part_number: str, site: str) -> List[InventoryResult]:
+        """Return mock Sherwin Williams FG inventory data"""
+        return []
+
+    def _mock_open_jobs(self, part_number: str, site: str) -> List[JobResult]:
+        """Return mock open jobs data"""
+        return []
+
+    def _mock_item_mapping(self, part_number: str) -> List[ItemMapping]:
+        """Return mock item mapping"""
+        # Generate a mock item code from part number
+        if part_number.startswith('L-'):
+            # Extract digits from part number
+            digits = ''.join(c for c in part_number if c.isdigit())
+            if digits:
+                return [ItemMapping(
+                    part_number=part_number,
+                    item_code=digits[:7],
+                    description=f"Label for {part_number}"
+                )]
+        return []
+
+    def _mock_movements(self, job_number: str) -> List[MovementResult]:
+        """Return mock movements data"""
+        return []
+
+
+_MOCK_BACKEND = _MockBackend()
+
+
 class SQLService:
     """
     Service for executing SQL queries against the ERP database.
@@ -79,29 +312,210 @@ class SQLService:
     def __init__(self):
         self.config = get_config()
         self.logger = get_logger()
-        self._connection = None
+        self._pool: Optional[queue.LifoQueue] = None  # Idle (connection, checked_at) pairs (None when disconnected)
+        self._pool_open = 0  # Connections open in the current pool (idle + in use)
+        self._pool_lock = threading.Lock()
+        self._held = threading.local()  # .count: pooled connections this thread is holding
+        self._pool_max_size = POOL_MAX_SIZE
+        self._pool_timeout = POOL_TIMEOUT
+        self._connection_string = None
         self._connection_error = None
+        self._connection_dropped = False  # Lost unexpectedly (not via disconnect) - reconnect on next use
+        self._supports_batches = False  # Server runs ;-separated statement batches (set by connect)
+        self._last_check_ts = 0.0  # time.monotonic() of the last successful liveness check
+        self._check_interval = 30  # Seconds a connection stays trusted before re-probing
+        self._prepared: Dict[str, Tuple[str, List[str]]] = {}  # query_type -> (? query, param names)
+        self._cache: OrderedDict = OrderedDict()  # (query_type, params) -> (expires_at, results)
+        self._cache_lock = threading.Lock()
+        self._backend = _MOCK_BACKEND  # Swapped for a _LiveBackend while connected
+        self.reload_queries()
+
+    def reload_queries(self):
+        """Re-read and compile configured SQL queries (call after the queries are edited)"""
+        prepared = {}
+        for query_type in SQL_QUERY_TYPES:
+            query = self.config.get_sql_query(query_type)
+            if query and query.strip():
+                prepared[query_type] = self._compile_query(query)
+        self._prepared = prepared
+        self.invalidate()
 
     def is_connected(self) -> bool:
-        """Check if database connection is available"""
-        if self._connection:
-            try:
-                # Test connection is still alive
-                cursor = self._connection.cursor()
-                cursor.execute("SELECT 1")
-                cursor.close()
-                return True
-            except Exception:
-                self._connection = None
+        """Check if database connection is available (probed at most every _check_interval seconds)"""
+        pool = self._pool
+        if pool is None:
+            return False
+        if time.monotonic() - self._last_check_ts < self._check_interval:
+            return True
+
+        # Probe an idle connection without waiting - if none is idle they're
+        # all busy running queries, which means the database is reachable
+        try:
+            connection, _ = pool.get_nowait()
+        except queue.Empty:
+            return True
+
+        try:
+            cursor = connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.close()
+        except Exception as e:
+            if self._is_connection_error(e):
+                try:
+                    connection.close()
+                except Exception:
+                    pass
+                self._mark_connection_dropped()
                 return False
+            # The server answered (e.g. SELECT 1 isn't valid SQL for it) - still connected
+        self._release(pool, connection)
+        self._last_check_ts = time.monotonic()
+        return True
+
+    def _reconnect_if_dropped(self) -> bool:
+        """Reconnect once if the connection dropped unexpectedly, else fall back to mock data"""
+        if self._connection_dropped:
+            self._connection_dropped = False
+            if self.connect()[0]:
+                return True
+        self._backend = _MOCK_BACKEND
         return False
 
+    def _mark_connection_dropped(self):
+        """Discard the pool after a connection failure so the next query path reconnects"""
+        if self._pool is not None:
+            self._close_pool()
+            self._connection_dropped = True
+        self._last_check_ts = 0.0
+
+    def _open_connection(self, connection_string: str):
+        """Open a new database connection"""
+        # Autocommit so idle pooled connections never hold an open transaction
+        return pyodbc.connect(connection_string, timeout=10, autocommit=True)
+
+    def _close_pool(self):
+        """Close all idle pooled connections (busy ones are closed when released)"""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+            self._pool_open = 0
+        while pool is not None:
+            try:
+                connection, _ = pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+    def _detect_batch_support(self, connection) -> bool:
+        """Check whether the connected server runs multi-statement batches (see BATCH_DBMS_NAMES)"""
+        try:
+            dbms_name = connection.getinfo(pyodbc.SQL_DBMS_NAME) or ''
+        except Exception:
+            return False
+        return dbms_name.startswith(BATCH_DBMS_NAMES)
+
+    def _validate_connection(self, connection) -> bool:
+        """Probe a connection with SELECT 1, closing it if it no longer works"""
+        try:
+            cursor = connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.close()
+            return True
+        except Exception:
+            try:
+                connection.close()
+            except Exception:
+                pass
+            return False
+
+    @contextmanager
+    def _acquire(self):
+        """
+        Borrow a pooled connection for the duration of a query.
+
+        Opens a new connection while fewer than the pool's max size are
+        open, otherwise waits up to its timeout for one to be released.
+        A thread that already holds a connection (e.g. mid-stream) raises
+        SQLPoolBusyError instead of waiting, since threads holding one
+        connection while waiting for another can deadlock each other.
+        Connections idle for _check_interval seconds or more are probed
+        first and replaced if the server dropped them.
+        """
+        pool = self._pool
+        if pool is None:
+            raise SQLExecutionError("Database not connected")
+
+        connection = None
+        try:
+            connection, checked_at = pool.get_nowait()
+        except queue.Empty:
+            with self._pool_lock:
+                can_open = self._pool is pool and self._pool_open < self._pool_max_size
+                if can_open:
+                    self._pool_open += 1
+            if not can_open:
+                if getattr(self._held, 'count', 0):
+                    raise SQLPoolBusyError("No free database connection while this thread holds one")
+                try:
+                    connection, checked_at = pool.get(timeout=self._pool_timeout)
+                except queue.Empty:
+                    raise SQLExecutionError("Timed out waiting for a database connection")
+
+        if connection is not None and time.monotonic() - checked_at >= self._check_interval:
+            if not self._validate_connection(connection):
+                connection = None  # Reopen below in the same pool slot
+
+        if connection is None:
+            try:
+                connection = self._open_connection(self._connection_string)
+            except Exception:
+                with self._pool_lock:
+                    if self._pool is pool:
+                        self._pool_open -= 1
+                raise
+
+        self._held.count = getattr(self._held, 'count', 0) + 1
+        try:
+            yield connection
+        except Exception as e:
+            self._held.count -= 1
+            if self._is_connection_error(e):
+                try:
+                    connection.close()
+                except Exception:
+                    pass
+                self._mark_connection_dropped()
+            else:
+                self._release(pool, connection)
+            raise
+        except BaseException:
+            # e.g. GeneratorExit when a streaming caller stops early
+            self._held.count -= 1
+            self._release(pool, connection)
+            raise
+        else:
+            self._held.count -= 1
+            self._release(pool, connection)
+
+    def _release(self, pool: queue.LifoQueue, connection):
+        """Return a connection to its pool, or close it if the pool was replaced"""
+        if self._pool is pool:
+            # It just completed a query, so it counts as checked now
+            pool.put((connection, time.monotonic()))
+        else:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
     def get_connection_status(self) -> Dict:
         """Get detailed connection status"""
         db_config = self.config.config.db_credentials
         return {
             'connected': self.is_connected(),
-            'pyodbc_available': PYODBC_AVAILABLE,
+            'pyodbc_available': _ensure_pyodbc(),
             'credentials_configured': db_config is not None and db_config.get('connection_string'),
             'error': self._connection_error
         }
@@ -113,7 +527,7 @@ class SQLService:
         Returns:
             Tuple of (success: bool, message: str)
         """
-        if not PYODBC_AVAILABLE:
+        if not _ensure_pyodbc():
             self._connection_error = "pyodbc not installed. Run: pip install pyodbc"
             return False, self._connection_error
 
@@ -123,9 +537,37 @@ class SQLService:
             return False, self._connection_error
 
         try:
+            max_size = max(1, int(db_config.get('pool_max_size', POOL_MAX_SIZE)))
+            min_size = min(max(1, int(db_config.get('pool_min_size', POOL_MIN_SIZE))), max_size)
+            timeout = float(db_config.get('pool_timeout', POOL_TIMEOUT))
+
             connection_string = db_config['connection_string']
-            self._connection = pyodbc.connect(connection_string, timeout=10)
+            connections = [self._open_connection(connection_string)]
+            try:
+                while len(connections) < min_size:
+                    connections.append(self._open_connection(connection_string))
+            except Exception:
+                for connection in connections:
+                    connection.close()
+                raise
+            supports_batches = self._detect_batch_support(connections[0])
+            self._close_pool()
+            pool = queue.LifoQueue()
+            checked_at = time.monotonic()
+            for connection in connections:
+                pool.put((connection, checked_at))
+            with self._pool_lock:
+                self._connection_string = connection_string
+                self._pool_max_size = max_size
+                self._pool_timeout = timeout
+                self._pool = pool
+                self._pool_open = len(connections)
+                self._supports_batches = supports_batches
             self._connection_error = None
+            self._connection_dropped = False
+            self._last_check_ts = time.monotonic()
+            self._backend = _LiveBackend(self)
+            self.reload_queries()
             self.logger.log_user_action("Database connected", "Connection established")
             return True, "Connected successfully"
         except Exception as e:
@@ -135,55 +577,127 @@ class SQLService:
 
     def disconnect(self):
         """Close database connection"""
-        if self._connection:
-            try:
-                self._connection.close()
-            except Exception:
-                pass
-            self._connection = None
+        self._connection_dropped = False
+        self._backend = _MOCK_BACKEND
+        self._close_pool()
 
-    def _validate_query(self, query_type: str) -> str:
-        """Validate and return query, raising error if not configured"""
-        query = self.config.get_sql_query(query_type)
-        if not query or not query.strip():
+    def _validate_query(self, query_type: str) -> Tuple[str, List[str]]:
+        """Return the prepared (? query, param names), raising error if not configured"""
+        try:
+            return self._prepared[query_type]
+        except KeyError:
             raise SQLNotConfiguredError(f"SQL query '{query_type}' is not configured")
-        return query
-
-    def _substitute_params(self, query: str, params: dict) -> str:
-        """Substitute :param_name style parameters in query"""
-        result = query
-        for key, value in (params or {}).items():
-            placeholder = f":{key}"
-            if value is None:
-                result = result.replace(placeholder, "NULL")
-            elif isinstance(value, str):
-                # Escape single quotes
-                escaped = value.replace("'", "''")
-                result = result.replace(placeholder, f"'{escaped}'")
+
+    def _compile_query(self, query: str) -> Tuple[str, List[str]]:
+        """
+        Convert :param_name style parameters to pyodbc ? placeholders.
+
+        Run once per query type by reload_queries(). Identical SQL text on
+        every call also lets the server reuse its cached execution plan.
+
+        Returns:
+            Tuple of (query with ? placeholders, parameter names in order)
+        """
+        parts = _PARAM_RE.split(query)
+        return '?'.join(parts[0::2]), parts[1::2]
+
+    def _bind_params(self, query_type: str, params: dict) -> Tuple[str, tuple]:
+        """
+        Bind parameter values for a prepared query.
+
+        Returns:
+            Tuple of (query with ? placeholders, parameter values in order)
+        """
+        final_query, names = self._validate_query(query_type)
+        params = params or {}
+        return final_query, tuple(params.get(name) for name in names)
+
+    def _is_connection_error(self, error: Exception) -> bool:
+        """Check if an exception means the connection itself is unusable"""
+        return PYODBC_AVAILABLE and isinstance(error, (pyodbc.OperationalError, pyodbc.InterfaceError))
+
+    def _fetch_results(self, cursor, row_factory: RowFactory = None, single: bool = False) -> List:
+        """
+        Read the cursor's current result set.
+
+        Rows are built with row_factory(col_index) (bound once) when given,
+        otherwise returned as dictionaries keyed by column name. With
+        single=True only the first row is read (fetchone).
+        """
+        # Get column names
+        columns = [column[0] for column in cursor.description] if cursor.description else []
+        if not columns:
+            return []
+
+        # Stream rows in FETCH_ARRAYSIZE chunks rather than holding a full fetchall() copy
+        cursor.arraysize = FETCH_ARRAYSIZE
+        if len(columns) == 1 and columns[0] == _FOR_JSON_COLUMN:
+            # FOR JSON output arrives as one document split across rows
+            chunks = []
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                chunks.extend(row[0] for row in rows)
+            payload = ''.join(chunks)
+            objects = _json_loads(payload) if payload else []
+            if isinstance(objects, dict):
+                objects = [objects]
+            if single:
+                objects = objects[:1]
+            if row_factory is None:
+                return objects
+            # FOR JSON omits NULL properties, so collect every key seen
+            columns = list(dict.fromkeys(key for obj in objects for key in obj))
+            build = row_factory({name: i for i, name in enumerate(columns)})
+            return [build(tuple(obj.get(c) for c in columns)) for obj in objects]
+
+        build = row_factory({name: i for i, name in enumerate(columns)}) if row_factory else None
+        if single:
+            row = cursor.fetchone()
+            if row is None:
+                return []
+            return [dict(zip(columns, row)) if build is None else build(row)]
+
+        results = []
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            if build is None:
+                results.extend(dict(zip(columns, row)) for row in rows)
             else:
-                result = result.replace(placeholder, str(value))
-        return result
+                results.extend(map(build, rows))
+        return results
 
-    def _execute_query(self, query: str, params: dict = None) -> List[Dict]:
+    def _execute_prepared(
+        self,
+        query_type: str,
+        params: dict = None,
+        row_factory: RowFactory = None,
+        single: bool = False
+    ) -> List:
         """
-        Execute a SQL query and return results as list of dictionaries.
+        Execute a prepared SQL query and return results as list of dictionaries.
 
         Args:
-            query: SQL query with :param_name style parameters
+            query_type: Configured query to run (see reload_queries)
             params: Dictionary of parameter values
+            row_factory: Optional factory(col_index) returning a builder for each row
+            single: Only fetch the first row (at most one result)
 
         Returns:
-            List of dictionaries with column names as keys
+            List of dictionaries with column names as keys (or row_factory results)
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
-        # Substitute parameters
-        final_query = self._substitute_params(query, params)
+        # Bind parameters
+        final_query, values = self._bind_params(query_type, params)
 
-        if not self.is_connected():
+        if self._pool is None and not self._reconnect_if_dropped():
             # Log attempt but return empty
             self.logger.log_sql_query(
-                query=final_query[:100],
+                query=final_query,
                 execution_time=0.0,
                 row_count=0,
                 error="Database not connected"
@@ -191,38 +705,257 @@ class SQLService:
             return []
 
         try:
-            cursor = self._connection.cursor()
-            cursor.execute(final_query)
-
-            # Get column names
-            columns = [column[0] for column in cursor.description] if cursor.description else []
+            with self._acquire() as connection:
+                cursor = connection.cursor()
+                cursor.execute(final_query, *values)
+                results = self._fetch_results(cursor, row_factory, single)
+                cursor.close()
 
-            # Fetch all rows and convert to dictionaries
-            rows = cursor.fetchall()
-            results = [dict(zip(columns, row)) for row in rows]
+            # Log success (sampled - see ActivityLogger.sql_log_every)
+            if self.logger.should_log_sql_query():
+                execution_time = time.perf_counter() - start_time
+                self.logger.log_sql_query(
+                    query=final_query,
+                    execution_time=execution_time,
+                    row_count=len(results)
+                )
 
-            cursor.close()
+            return results
 
-            # Log success
-            execution_time = (datetime.now() - start_time).total_seconds()
+        except SQLPoolBusyError:
+            raise
+        except Exception as e:
+            execution_time = time.perf_counter() - start_time
             self.logger.log_sql_query(
-                query=final_query[:100],
+                query=final_query,
                 execution_time=execution_time,
-                row_count=len(results)
+                row_count=0,
+                error=str(e)
             )
+            raise SQLExecutionError(f"Query failed: {str(e)}")
 
-            return results
+    def _stream_prepared(
+        self,
+        query_type: str,
+        params: dict,
+        row_factory: RowFactory,
+        chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[List]:
+        """
+        Execute a prepared SQL query, yielding built rows in chunks of up to chunk_size.
+
+        Rows are only fetched from the server as the caller consumes them.
+        If the caller stops early, the statement is cancelled and the
+        connection returned to the pool.
+        """
+        start_time = time.perf_counter()
+        final_query, values = self._bind_params(query_type, params)
+
+        if self._pool is None and not self._reconnect_if_dropped():
+            self.logger.log_sql_query(
+                query=final_query,
+                execution_time=0.0,
+                row_count=0,
+                error="Database not connected"
+            )
+            return
+
+        row_count = 0
+        try:
+            with self._acquire() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.execute(final_query, *values)
+                    columns = [column[0] for column in cursor.description] if cursor.description else []
+                    if columns == [_FOR_JSON_COLUMN]:
+                        # A FOR JSON document has to be read whole before it can be parsed
+                        results = self._fetch_results(cursor, row_factory)
+                        for i in range(0, len(results), chunk_size):
+                            chunk = results[i:i + chunk_size]
+                            row_count += len(chunk)
+                            yield chunk
+                    elif columns:
+                        build = row_factory({name: i for i, name in enumerate(columns)})
+                        while True:
+                            rows = cursor.fetchmany(chunk_size)
+                            if not rows:
+                                break
+                            row_count += len(rows)
+                            yield list(map(build, rows))
+                except GeneratorExit:
+                    # Stopped early - don't let the server keep sending rows
+                    cursor.cancel()
+                    raise
+                finally:
+                    cursor.close()
+
+            if self.logger.should_log_sql_query():
+                self.logger.log_sql_query(
+                    query=final_query,
+                    execution_time=time.perf_counter() - start_time,
+                    row_count=row_count
+                )
+
+        except (GeneratorExit, SQLPoolBusyError):
+            raise
+        except Exception as e:
+            self.logger.log_sql_query(
+                query=final_query,
+                execution_time=time.perf_counter() - start_time,
+                row_count=0,
+                error=str(e)
+            )
+            raise SQLExecutionError(f"Query failed: {str(e)}")
+
+    def _execute_many(self, queries: List[Tuple[str, dict, Optional[RowFactory]]]) -> List[List]:
+        """
+        Execute several queries as one batch (a single round-trip).
+
+        On servers that accept multi-statement batches (see BATCH_DBMS_NAMES)
+        the queries are sent together and each result set is read in turn
+        with cursor.nextset(). Otherwise they run one after another on the
+        same connection.
+
+        Args:
+            queries: List of (query_type, params, row_factory) tuples
 
+        Returns:
+            One list of results per query, in the same order
+        """
+        if not queries:
+            return []
+
+        statements = [self._bind_params(query_type, params) for query_type, params, _ in queries]
+        values = [value for _, statement_values in statements for value in statement_values]
+        if self._supports_batches and len(values) > MAX_BATCH_PARAMS and len(queries) > 1:
+            half = len(queries) // 2
+            return self._execute_many(queries[:half]) + self._execute_many(queries[half:])
+
+        start_time = time.perf_counter()
+        final_query = ';\n'.join(statement.strip().rstrip(';') for statement, _ in statements)
+
+        if self._pool is None and not self._reconnect_if_dropped():
+            self.logger.log_sql_query(
+                query=final_query,
+                execution_time=0.0,
+                row_count=0,
+                error="Database not connected"
+            )
+            return [[] for _ in queries]
+
+        try:
+            with self._acquire() as connection:
+                cursor = connection.cursor()
+                if self._supports_batches:
+                    cursor.execute(final_query, *values)
+                    result_sets = [self._fetch_results(cursor, queries[0][2])]
+                    while len(result_sets) < len(queries) and cursor.nextset():
+                        result_sets.append(self._fetch_results(cursor, queries[len(result_sets)][2]))
+                else:
+                    result_sets = []
+                    for (statement, statement_values), (_, _, row_factory) in zip(statements, queries):
+                        cursor.execute(statement, *statement_values)
+                        result_sets.append(self._fetch_results(cursor, row_factory))
+                cursor.close()
+            result_sets.extend([] for _ in range(len(queries) - len(result_sets)))
+
+            if self.logger.should_log_sql_query():
+                execution_time = time.perf_counter() - start_time
+                self.logger.log_sql_query(
+                    query=final_query,
+                    execution_time=execution_time,
+                    row_count=sum(len(results) for results in result_sets)
+                )
+
+            return result_sets
+
+        except SQLPoolBusyError:
+            raise
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             self.logger.log_sql_query(
-                query=final_query[:100],
+                query=final_query,
                 execution_time=execution_time,
                 row_count=0,
                 error=str(e)
             )
             raise SQLExecutionError(f"Query failed: {str(e)}")
 
+    def invalidate(self, query_type: str = None):
+        """
+        Drop cached query results.
+
+        Args:
+            query_type: Only drop results for this query type (default: all)
+        """
+        with self._cache_lock:
+            if query_type is None:
+                self._cache.clear()
+            else:
+                for key in [key for key in self._cache if key[0] == query_type]:
+                    del self._cache[key]
+
+    def _cache_get(self, key: tuple) -> Optional[List[Dict]]:
+        """Return a copy of the cached results for key, or None if missing/expired"""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            # Callers get their own list so sorting/appending can't alter later hits
+            return list(entry[1])
+
+    def _cache_put(self, key: tuple, results: List[Dict]):
+        """Store results for key using the query type's TTL"""
+        ttl = RESULT_CACHE_TTL.get(key[0])
+        if not ttl or self._pool is None:
+            return
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic() + ttl, tuple(results))
+            self._cache.move_to_end(key)
+            while len(self._cache) > RESULT_CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
+    def _cached_execute(
+        self,
+        query_type: str,
+        params: dict,
+        row_factory: RowFactory = None,
+        single: bool = False
+    ) -> List:
+        """Execute a query, reusing results from the last RESULT_CACHE_TTL seconds"""
+        key = (query_type, tuple(sorted(params.items())))
+        results = self._cache_get(key)
+        if results is None:
+            results = self._execute_prepared(query_type, params, row_factory, single)
+            self._cache_put(key, results)
+        return results
+
+    def _cached_execute_many(self, queries: List[Tuple[str, dict, Optional[RowFactory]]]) -> List[List]:
+        """
+        Execute several queries as one batch, skipping those with cached results.
+
+        Args:
+            queries: List of (query_type, params, row_factory) tuples
+
+        Returns:
+            One list of results per query, in the same order
+        """
+        keys = [(query_type, tuple(sorted(params.items()))) for query_type, params, _ in queries]
+        result_sets = [self._cache_get(key) for key in keys]
+        misses = [i for i, results in enumerate(result_sets) if results is None]
+
+        if misses:
+            fetched = self._execute_many([queries[i] for i in misses])
+            for i, results in zip(misses, fetched):
+                result_sets[i] = results
+                self._cache_put(keys[i], results)
+
+        return result_sets
+
     def get_fg_inventory(self, part_number: str, site: str = None) -> List[InventoryResult]:
         """
         Get Finished Goods inventory for a part number.
@@ -234,26 +967,11 @@ class SQLService:
         Returns:
             List of InventoryResult with available FG inventory
         """
-        try:
-            query = self._validate_query('fg_inventory')
-        except SQLNotConfiguredError:
-            # Return empty if not configured
+        # Return empty if not configured
+        if 'fg_inventory' not in self._prepared:
             return []
 
-        # Return mock data if not connected
-        if not self.is_connected():
-            return self._mock_fg_inventory(part_number, site)
-
-        results = self._execute_query(query, {'part_number': part_number, 'site': site})
-        return [
-            InventoryResult(
-                item_code=r.get('item_code', ''),
-                job_number=r.get('job_number'),
-                quantity=r.get('quantity', 0),
-                location=r.get('location')
-            )
-            for r in results
-        ]
+        return self._backend.fetch('fg_inventory', {'part_number': part_number, 'site': site}, _inventory_row)
 
     def get_wip_inventory(self, part_number: str, site: str = None) -> List[InventoryResult]:
         """
@@ -266,24 +984,10 @@ class SQLService:
         Returns:
             List of InventoryResult with available WIP inventory
         """
-        try:
-            query = self._validate_query('wip_inventory')
-        except SQLNotConfiguredError:
+        if 'wip_inventory' not in self._prepared:
             return []
 
-        if not self.is_connected():
-            return self._mock_wip_inventory(part_number, site)
-
-        results = self._execute_query(query, {'part_number': part_number, 'site': site})
-        return [
-            InventoryResult(
-                item_code=r.get('item_code', ''),
-                job_number=r.get('job_number'),
-                quantity=r.get('quantity', 0),
-                location=r.get('location')
-            )
-            for r in results
-        ]
+        return self._backend.fetch('wip_inventory', {'part_number': part_number, 'site': site}, _inventory_row)
 
     def get_sw_fg_inventory(self, part_number: str, site: str = None) -> List[InventoryResult]:
         """
@@ -296,24 +1000,10 @@ class SQLService:
         Returns:
             List of InventoryResult with available SW FG inventory
         """
-        try:
-            query = self._validate_query('sw_fg')
-        except SQLNotConfiguredError:
+        if 'sw_fg' not in self._prepared:
             return []
 
-        if not self.is_connected():
-            return self._mock_sw_fg_inventory(part_number, site)
-
-        results = self._execute_query(query, {'part_number': part_number, 'site': site})
-        return [
-            InventoryResult(
-                item_code=r.get('item_code', ''),
-                job_number=r.get('job_number'),
-                quantity=r.get('quantity', 0),
-                location=r.get('location')
-            )
-            for r in results
-        ]
+        return self._backend.fetch('sw_fg', {'part_number': part_number, 'site': site}, _inventory_row)
 
     def get_open_jobs(self, part_number: str, site: str = None) -> List[JobResult]:
         """
@@ -326,27 +1016,58 @@ class SQLService:
         Returns:
             List of JobResult with open jobs
         """
-        try:
-            query = self._validate_query('open_jobs')
-        except SQLNotConfiguredError:
+        if 'open_jobs' not in self._prepared:
             return []
 
-        if not self.is_connected():
-            return self._mock_open_jobs(part_number, site)
-
-        results = self._execute_query(query, {'part_number': part_number, 'site': site})
-        return [
-            JobResult(
-                job_number=r.get('job_number', ''),
-                item_code=r.get('item_code', ''),
-                part_number=r.get('part_number', ''),
-                quantity_ordered=r.get('quantity_ordered', 0),
-                quantity_produced=r.get('quantity_produced', 0),
-                quantity_remaining=r.get('quantity_remaining', 0),
-                status=r.get('status', 'UNKNOWN')
-            )
-            for r in results
-        ]
+        return self._backend.fetch('open_jobs', {'part_number': part_number, 'site': site}, _job_row)
+
+    def iter_open_jobs(self, part_number: str, site: str = None) -> Iterator[JobResult]:
+        """
+        Iterate open production jobs for a part number, fetching them as they're consumed.
+
+        Stopping early (e.g. break once a job is found) stops the remaining
+        rows being fetched from the database. A pooled connection is held
+        while iterating, so other queries made meanwhile raise
+        SQLPoolBusyError rather than wait if the pool has no free connection.
+
+        Args:
+            part_number: The part number to look up
+            site: Optional site filter
+
+        Yields:
+            JobResult for each open job
+        """
+        with closing(self._iter_open_job_chunks(part_number, site)) as chunks:
+            for jobs in chunks:
+                yield from jobs
+
+    def _iter_open_job_chunks(self, part_number: str, site: str) -> Iterator[List[JobResult]]:
+        """Yield open jobs in chunks, streamed from the database unless cached"""
+        if 'open_jobs' not in self._prepared:
+            return
+
+        params = {'part_number': part_number, 'site': site}
+        if not self._backend.connected or self._pool_max_size < 2:
+            # Mock data, or a single-connection pool that must stay free for
+            # the movement queries made while the jobs are being checked
+            jobs = self._backend.fetch('open_jobs', params, _job_row)
+            if jobs:
+                yield jobs
+            return
+
+        key = ('open_jobs', tuple(sorted(params.items())))
+        jobs = self._cache_get(key)
+        if jobs is not None:
+            if jobs:
+                yield jobs
+            return
+
+        jobs = []
+        for chunk in self._stream_prepared('open_jobs', params, _job_row):
+            jobs.extend(chunk)
+            yield chunk
+        # Only reached when every row was read - partial lists aren't cached
+        self._cache_put(key, jobs)
 
     def get_item_mapping(self, part_number: str) -> Optional[ItemMapping]:
         """
@@ -358,23 +1079,14 @@ class SQLService:
         Returns:
             ItemMapping if found, None otherwise
         """
-        try:
-            query = self._validate_query('item_mapping')
-        except SQLNotConfiguredError:
+        if 'item_mapping' not in self._prepared:
             return None
 
-        if not self.is_connected():
-            return self._mock_item_mapping(part_number)
-
-        results = self._execute_query(query, {'part_number': part_number})
-        if results:
-            r = results[0]
-            return ItemMapping(
-                part_number=r.get('part_number', part_number),
-                item_code=r.get('item_code', ''),
-                description=r.get('description')
-            )
-        return None
+        # The mapping should be unique - only the first row is read
+        results = self._backend.fetch(
+            'item_mapping', {'part_number': part_number}, _item_mapping_row_factory(part_number), single=True
+        )
+        return results[0] if results else None
 
     def get_movements_for_job(self, job_number: str) -> List[MovementResult]:
         """
@@ -386,70 +1098,234 @@ class SQLService:
         Returns:
             List of MovementResult with active movements
         """
-        try:
-            query = self._validate_query('movements')
-        except SQLNotConfiguredError:
+        if 'movements' not in self._prepared:
             return []
 
-        if not self.is_connected():
-            return self._mock_movements(job_number)
-
-        results = self._execute_query(query, {'job_number': job_number})
-        return [
-            MovementResult(
-                movement_id=r.get('movement_id', ''),
-                job_number=r.get('job_number', job_number),
-                quantity=r.get('quantity', 0),
-                status=r.get('status', 'UNKNOWN'),
-                created_date=r.get('created_date', datetime.now())
-            )
-            for r in results
-        ]
+        return self._backend.fetch(
+            'movements', {'job_number': job_number}, _movement_row_factory(job_number)
+        )
 
     def get_total_movements_for_job(self, job_number: str) -> int:
-        """Get total quantity of active movements for a job"""
-        movements = self.get_movements_for_job(job_number)
-        return sum(m.quantity for m in movements if m.status in ('ACTIVE', 'PENDING', 'OPEN'))
+        """
+        Get total quantity of active movements for a job.
 
-    # ============== MOCK DATA FOR TESTING ==============
+        Uses the 'movements_total' aggregate query when configured, so only
+        a single value crosses the network; otherwise sums the movement rows.
+        """
+        if 'movements_total' not in self._prepared:
+            movements = self.get_movements_for_job(job_number)
+            return sum(m.quantity for m in movements if m.status in _ACTIVE_STATUSES)
 
-    def _mock_fg_inventory(self, part_number: str, site: str) -> List[InventoryResult]:
-        """Return mock FG inventory data"""
-        # Return empty to simulate no inventory (forces job creation logic)
-        return []
+        results = self._backend.fetch('movements_total', {'job_number': job_number}, _total_row)
+        return results[0] if results else 0
 
-    def _mock_wip_inventory(self, part_number: str, site: str) -> List[InventoryResult]:
-        """Return mock WIP inventory data"""
-        return []
+    def get_movements_for_jobs(self, job_numbers: List[str]) -> Dict[str, List[MovementResult]]:
+        """
+        Get active movements/allocations for several jobs in one round-trip.
 
-    def _mock_sw_fg_inventory(self, part_number: str, site: str) -> List[InventoryResult]:
-        """Return mock Sherwin Williams FG inventory data"""
-        return []
+        Args:
+            job_numbers: The job numbers to look up
 
-    def _mock_open_jobs(self, part_number: str, site: str) -> List[JobResult]:
-        """Return mock open jobs data"""
-        return []
+        Returns:
+            Dict of job_number -> List of MovementResult
+        """
+        if not job_numbers:
+            return {}
 
-    def _mock_item_mapping(self, part_number: str) -> Optional[ItemMapping]:
-        """Return mock item mapping"""
-        # Generate a mock item code from part number
-        if part_number.startswith('L-'):
-            # Extract digits from part number
-            digits = ''.join(c for c in part_number if c.isdigit())
-            if digits:
-                return ItemMapping(
-                    part_number=part_number,
-                    item_code=digits[:7],
-                    description=f"Label for {part_number}"
-                )
-        return None
+        if 'movements' not in self._prepared:
+            return {job_number: [] for job_number in job_numbers}
 
-    def _mock_movements(self, job_number: str) -> List[MovementResult]:
-        """Return mock movements data"""
-        return []
+        result_sets = self._backend.fetch_many([
+            ('movements', {'job_number': j}, _movement_row_factory(j))
+            for j in job_numbers
+        ])
+        return dict(zip(job_numbers, result_sets))
+
+    def bulk_create_movements(self, movements: List[MovementResult]) -> int:
+        """
+        Insert movement records in a single batched round-trip.
+
+        Uses the configured 'create_movement' statement, executed once per
+        movement via pyodbc's fast_executemany (parameter arrays are sent
+        to the server in one batch instead of one INSERT per row).
+
+        Args:
+            movements: Movements to insert
+
+        Returns:
+            Number of movements written (0 if not configured or not connected)
+        """
+        if not movements:
+            return 0
+
+        prepared = self._prepared.get('create_movement')
+        if prepared is None:
+            return 0
+        final_query, names = prepared
+
+        start_time = time.perf_counter()
+
+        if not self._backend.connected:
+            self.logger.log_sql_query(
+                query=final_query,
+                execution_time=0.0,
+                row_count=0,
+                error="Database not connected"
+            )
+            return 0
+
+        try:
+            rows = [
+                tuple(getattr(m, name) for name in names)
+                for m in movements
+            ]
+
+            with self._acquire() as connection:
+                # All rows in one transaction
+                connection.autocommit = False
+                try:
+                    cursor = connection.cursor()
+                    cursor.fast_executemany = True
+                    cursor.executemany(final_query, rows)
+                    connection.commit()
+                    cursor.close()
+                except Exception:
+                    connection.rollback()
+                    raise
+                finally:
+                    connection.autocommit = True
+            self.invalidate('movements')
+            self.invalidate('movements_total')
+
+            execution_time = time.perf_counter() - start_time
+            self.logger.log_sql_query(
+                query=final_query,
+                execution_time=execution_time,
+                row_count=len(rows)
+            )
+            return len(rows)
+
+        except Exception as e:
+            execution_time = time.perf_counter() - start_time
+            self.logger.log_sql_query(
+                query=final_query,
+                execution_time=execution_time,
+                row_count=0,
+                error=str(e)
+            )
+            raise SQLExecutionError(f"Bulk insert failed: {str(e)}")
+
+    def get_movement_totals_for_jobs(self, job_numbers: List[str]) -> Dict[str, int]:
+        """
+        Get total quantity of active movements for several jobs in one round-trip.
+
+        Args:
+            job_numbers: The job numbers to look up
+
+        Returns:
+            Dict of job_number -> total active movement quantity
+        """
+        if not job_numbers:
+            return {}
+
+        if 'movements_total' not in self._prepared:
+            return {
+                job_number: sum(m.quantity for m in movements if m.status in _ACTIVE_STATUSES)
+                for job_number, movements in self.get_movements_for_jobs(job_numbers).items()
+            }
+
+        result_sets = self._backend.fetch_many([
+            ('movements_total', {'job_number': j}, _total_row)
+            for j in job_numbers
+        ])
+        return {
+            job_number: results[0] if results else 0
+            for job_number, results in zip(job_numbers, result_sets)
+        }
 
     # ============== INVENTORY CHECK LOGIC ==============
 
+    def _get_coverage_sources(
+        self,
+        part_number: str,
+        site: str,
+        query_types: Sequence[str] = tuple(_INVENTORY_TOTAL_QUERIES)
+    ) -> Tuple[Dict[str, int], Dict[str, List[InventoryResult]]]:
+        """
+        Get inventory totals for a part (FG, WIP and SW FG by default) in one round-trip.
+
+        Sources with a configured total query (see _INVENTORY_TOTAL_QUERIES)
+        only fetch their total; their rows are left out of the inventory
+        dict and fetched by _first_inventory_row if that source wins.
+
+        Returns:
+            Tuple of (totals by query type, inventory rows by query type)
+        """
+        params = {'part_number': part_number, 'site': site}
+        queries = []
+        for query_type in query_types:
+            total_type = _INVENTORY_TOTAL_QUERIES[query_type]
+            if total_type in self._prepared:
+                queries.append((total_type, params, _total_row))
+            elif query_type in self._prepared:
+                queries.append((query_type, params, _inventory_row))
+        result_sets = dict(zip([qt for qt, _, _ in queries], self._backend.fetch_many(queries)))
+
+        totals = {}
+        inventory = {}
+        for query_type in query_types:
+            total_type = _INVENTORY_TOTAL_QUERIES[query_type]
+            if total_type in result_sets:
+                results = result_sets[total_type]
+                totals[query_type] = results[0] if results else 0
+            else:
+                inventory[query_type] = result_sets.get(query_type, [])
+                totals[query_type] = _total_quantity(inventory[query_type])
+        return totals, inventory
+
+    def _coverage_total(
+        self,
+        query_type: str,
+        totals: Dict[str, int],
+        inventory: Dict[str, List[InventoryResult]],
+        part_number: str,
+        site: str
+    ) -> int:
+        """Get one source's total, fetching it on its own unless it was already batched"""
+        if query_type not in totals:
+            source_totals, source_inventory = self._get_coverage_sources(part_number, site, (query_type,))
+            totals.update(source_totals)
+            inventory.update(source_inventory)
+        return totals[query_type]
+
+    def _first_inventory_row(
+        self,
+        query_type: str,
+        inventory: Dict[str, List[InventoryResult]],
+        part_number: str,
+        site: str
+    ) -> Optional[InventoryResult]:
+        """Get the first row of a covering inventory source, fetching rows only if just its total was queried"""
+        rows = inventory.get(query_type)
+        if rows is None:
+            if query_type not in self._prepared:
+                return None
+            rows = self._backend.fetch(query_type, {'part_number': part_number, 'site': site}, _inventory_row)
+        return rows[0] if rows else None
+
+    def _job_capacities(self, open_jobs: List[JobResult]) -> Tuple[List[int], List[int]]:
+        """
+        Get existing movements and spare capacity for each open job, column-wise.
+
+        Returns:
+            Tuple of (existing movement totals, quantity_remaining - existing), in job order
+        """
+        job_numbers = list(map(_get_job_number, open_jobs))
+        movement_totals = self.get_movement_totals_for_jobs(job_numbers)
+        existing = list(map(movement_totals.get, job_numbers, repeat(0)))
+        available = list(map(sub, map(_get_quantity_remaining, open_jobs), existing))
+        return existing, available
+
     def check_inventory_coverage(
         self,
         part_number: str,
@@ -503,76 +1379,89 @@ class SQLService:
             'details': ''
         }
 
+        # Fetch all inventory sources up front when they fit in one batch;
+        # otherwise each source is only queried if the ones before it fall short
+        if self._backend.connected and self._supports_batches:
+            totals, inventory = self._get_coverage_sources(part_number, site)
+        else:
+            totals, inventory = {}, {}
+
         # 1. Check FG inventory
-        fg_inventory = self.get_fg_inventory(part_number, site)
-        total_fg = sum(inv.quantity for inv in fg_inventory)
+        total_fg = self._coverage_total('fg_inventory', totals, inventory, part_number, site)
         result['fg_available'] = total_fg
 
         if total_fg >= order_qty:
             # Can fulfill from FG
             result['action'] = 'movement'
             result['source'] = 'fg'
-            if fg_inventory:
-                result['job_number'] = fg_inventory[0].job_number
-                result['item_code'] = fg_inventory[0].item_code
+            first = self._first_inventory_row('fg_inventory', inventory, part_number, site)
+            if first:
+                result['job_number'] = first.job_number
+                result['item_code'] = first.item_code
             result['details'] = f"FG inventory ({total_fg:,}) covers order ({order_qty:,})"
             return result
 
         # 2. Check WIP inventory
-        wip_inventory = self.get_wip_inventory(part_number, site)
-        total_wip = sum(inv.quantity for inv in wip_inventory)
+        total_wip = self._coverage_total('wip_inventory', totals, inventory, part_number, site)
         result['wip_available'] = total_wip
 
         if total_wip >= order_qty:
             # Can fulfill from WIP
             result['action'] = 'movement'
             result['source'] = 'wip'
-            if wip_inventory:
-                result['job_number'] = wip_inventory[0].job_number
-                result['item_code'] = wip_inventory[0].item_code
+            first = self._first_inventory_row('wip_inventory', inventory, part_number, site)
+            if first:
+                result['job_number'] = first.job_number
+                result['item_code'] = first.item_code
             result['details'] = f"WIP inventory ({total_wip:,}) covers order ({order_qty:,})"
             return result
 
         # 3. Check Sherwin Williams FG inventory
-        sw_fg_inventory = self.get_sw_fg_inventory(part_number, site)
-        total_sw_fg = sum(inv.quantity for inv in sw_fg_inventory)
+        total_sw_fg = self._coverage_total('sw_fg', totals, inventory, part_number, site)
         result['sw_fg_available'] = total_sw_fg
 
         if total_sw_fg >= order_qty:
             # Can fulfill from SW FG
             result['action'] = 'movement'
             result['source'] = 'sw_fg'
-            if sw_fg_inventory:
-                result['job_number'] = sw_fg_inventory[0].job_number
-                result['item_code'] = sw_fg_inventory[0].item_code
+            first = self._first_inventory_row('sw_fg', inventory, part_number, site)
+            if first:
+                result['job_number'] = first.job_number
+                result['item_code'] = first.item_code
             result['details'] = f"SW FG inventory ({total_sw_fg:,}) covers order ({order_qty:,})"
             return result
 
-        # 4. Check open jobs (and their existing movements)
-        open_jobs = self.get_open_jobs(part_number, site)
+        # 4. Check open jobs (and their existing movements), a chunk at a time
+        # so a covering job stops the rest of the list being fetched
         total_job_capacity = 0
-
-        for job in open_jobs:
-            # Get existing movements for this job
-            existing_movements = self.get_total_movements_for_job(job.job_number)
-
-            # Calculate available capacity (job remaining - already committed movements)
-            available = job.quantity_remaining - existing_movements
-
-            if available > 0:
-                total_job_capacity += available
-                result['existing_movements'] = existing_movements
-
-                if available >= order_qty:
-                    # This job can cover the order
+        with closing(self._iter_open_job_chunks(part_number, site)) as chunks:
+            for open_jobs in chunks:
+                try:
+                    existing, available = self._job_capacities(open_jobs)
+                except SQLPoolBusyError:
+                    # No second connection free while streaming - read the rest of
+                    # the jobs (releasing the stream's connection), then look them up
+                    open_jobs = open_jobs + [job for chunk in chunks for job in chunk]
+                    existing, available = self._job_capacities(open_jobs)
+
+                # First job with spare capacity that covers the whole order
+                winner = next((i for i, spare in enumerate(available) if spare > 0 and spare >= order_qty), None)
+                if winner is not None:
+                    job = open_jobs[winner]
                     result['action'] = 'movement'
                     result['source'] = 'job'
                     result['job_number'] = job.job_number
                     result['item_code'] = job.item_code
-                    result['jobs_available'] = available
-                    result['details'] = f"Job {job.job_number} has capacity ({available:,}) for order ({order_qty:,}). Existing movements: {existing_movements:,}"
+                    result['jobs_available'] = available[winner]
+                    result['existing_movements'] = existing[winner]
+                    result['details'] = f"Job {job.job_number} has capacity ({available[winner]:,}) for order ({order_qty:,}). Existing movements: {existing[winner]:,}"
                     return result
 
+                with_capacity = [i for i, spare in enumerate(available) if spare > 0]
+                total_job_capacity += sum(available[i] for i in with_capacity)
+                if with_capacity:
+                    result['existing_movements'] = existing[with_capacity[-1]]
+
         # Record total job capacity even if not enough
         result['jobs_available'] = total_job_capacity
 
@@ -595,11 +1484,15 @@ class SQLService:
 
 # Global service instance
 _sql_service: Optional[SQLService] = None
+_sql_service_lock = threading.Lock()
 
 
 def get_sql_service() -> SQLService:
     """Get the global SQL service instance"""
     global _sql_service
     if _sql_service is None:
-        _sql_service = SQLService()
+        # Flask serves requests on threads - only one may create the service
+        with _sql_service_lock:
+            if _sql_service is None:
+                _sql_service = SQLService()
     return _sql_service
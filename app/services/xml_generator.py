@@ -12,9 +12,10 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Optional, Tuple
-import math
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
+from functools import lru_cache
+from xml.sax.saxutils import escape
+import os
+import string
 
 
 # Constants
@@ -23,23 +24,137 @@ PLANT = "14"
 CUSTOMER_CODE = "SHER003"
 BASE_ADDRESS = "12977"
 DELIVERY_METHOD = "TRK"
+WRITE_BUFFER_SIZE = 1 << 19  # Output file buffer (bytes)
+NEWLINE = '\r\n'  # The order-entry import has always received CRLF files (see outputs/ samples)
+
+# File prologue/epilogue, pre-encoded for the binary writers
+_STOCK_PROLOGUE = (
+    '<?xml version="1.0" encoding="UTF-8"?>\r\n'
+    f'<!DOCTYPE orders SYSTEM "{DTD_URL}">\r\n'
+    '\r\n'
+    '<!--Generated from customer order entry -->\r\n'
+    '\r\n'
+    '<orders>\r\n'
+).encode()
+_MOVEMENT_PROLOGUE = (
+    '<?xml version="1.0" encoding="UTF-8"?>\r\n'
+    f'<!DOCTYPE orders SYSTEM "{DTD_URL}">\r\n'
+    '\r\n'
+    '<!--Generated from S-W Order Entry Interface -->\r\n'
+    '\r\n'
+    '<orders>\r\n'
+).encode()
+_EPILOGUE = b'</orders>'
+
+# Order templates - constants are filled in once here; the remaining {fields} mark
+# where per-order values go (see _template_fragments)
+# Match exact schema from sample: address before code in order-customer
+_STOCK_ORDER_TMPL = f'''<order signal="submit" plant="{PLANT}">
+   <header>
+      <order-customer address="{BASE_ADDRESS}" code="{CUSTOMER_CODE}">
+         <po>{{po_num}}</po>
+      </order-customer>
+      <invoice-customer address="{BASE_ADDRESS}"/>
+      <delivery-customer address="{{delivery_address}}" date="{{delivery_date}}">
+         <delivery-method code="{DELIVERY_METHOD}">
+            <freight>
+               <prepaid />
+            </freight>
+         </delivery-method>
+      </delivery-customer>
+    <request-options po-received="{{po_received}}" crif="{{crif}}" crif-ship="{{crif}}" />
+   </header>
+   <lines>
+      <line quantity="{{quantity}}" run-type="normal">
+         <option>
+          <book-stock-job price="{{price:.2f}}" price-qty="{{price_qty}}" />
+         </option>
+         <item>
+            <customer-reference-number>{{part_number}}</customer-reference-number>
+         </item>
+      </line>
+   </lines>
+</order>
+'''
+
+# option is 'wip' or 'stock' (fail-if-insufficient-wip / -stock)
+_MOVEMENT_ORDER_TMPL = f'''<order signal="submit" plant="{PLANT}">
+  <header>
+    <order-customer code="{CUSTOMER_CODE}" address="{BASE_ADDRESS}">
+      <po>{{po_number}}</po>
+      <ro>{{ro:03d}}</ro>
+    </order-customer>
+    <invoice-customer code="{CUSTOMER_CODE}" address="{BASE_ADDRESS}"></invoice-customer>
+    <delivery-customer code="{CUSTOMER_CODE}" address="{{delivery_address}}" date="{{delivery_date}}">
+      <delivery-method code="{DELIVERY_METHOD}">
+        <freight>
+           <collect />
+        </freight>
+      </delivery-method>
+    </delivery-customer>
+    <request-options po-received="{{po_received}}" crif="{{crif}}" />
+  </header>
+  <lines>
+    <line quantity="{{quantity}}" run-type="normal">
+       <option>
+          <fail-if-insufficient-{{option}} job-number="{{job_number}}" price="{{price}}" price-qty="{{price_qty}}" />
+       </option>
+    <item>
+      <item-code>{{item_code}}</item-code>
+    </item>
+    </line>
+  </lines>
+</order>
+'''
+
 
+def _template_fragments(template: str, *names: str) -> Tuple[str, ...]:
+    """
+    Split an order template into the literal text around its fields.
 
-@dataclass
+    The generators join these fragments with the field values directly,
+    which is much cheaper per order than format_map(). names must list the
+    template's fields in order so a template edit can't silently misplace values.
+    Line breaks in the template are converted to NEWLINE.
+    """
+    parsed = list(string.Formatter().parse(template))
+    fields = tuple(name for _, name, _, _ in parsed if name is not None)
+    if fields != names:
+        raise ValueError(f"Template fields {fields} do not match {names}")
+    fragments = [text.replace('\n', NEWLINE) for text, _, _, _ in parsed]
+    if parsed[-1][1] is not None:
+        fragments.append('')
+    return tuple(fragments)
+
+
+_STOCK_FRAGS = _template_fragments(
+    _STOCK_ORDER_TMPL,
+    'po_num', 'delivery_address', 'delivery_date', 'po_received', 'crif', 'crif',
+    'quantity', 'price', 'price_qty', 'part_number',
+)
+_MOVEMENT_FRAGS = _template_fragments(
+    _MOVEMENT_ORDER_TMPL,
+    'po_number', 'ro', 'delivery_address', 'delivery_date', 'po_received', 'crif',
+    'quantity', 'option', 'job_number', 'price', 'price_qty', 'item_code',
+)
+
+
+@dataclass(slots=True)
 class StockJobLine:
     """Single line item for a stock job"""
     part_number: str  # customer-reference-number
     quantity: int  # Will be rounded to 500
     price: float = 100.00
     price_qty: int = 1000
+    quantity_rounded: int = field(init=False)  # quantity rounded UP to nearest 500
 
-    @property
-    def quantity_rounded(self) -> int:
-        """Round UP to nearest 500"""
-        return math.ceil(self.quantity / 500) * 500
+    def __post_init__(self):
+        # Integer ceil-div: exact for any quantity, no float round-trip
+        # (int() keeps the result an int if quantity arrived as a float)
+        self.quantity_rounded = int(-(-self.quantity // 500)) * 500
 
 
-@dataclass
+@dataclass(slots=True)
 class StockJob:
     """Stock job order (from forecast)"""
     lines: List[StockJobLine]
@@ -48,13 +163,15 @@ class StockJob:
     po_received_date: Optional[datetime] = None
 
     def __post_init__(self):
-        if self.delivery_date is None:
-            self.delivery_date = datetime.now() + timedelta(days=21)
-        if self.po_received_date is None:
-            self.po_received_date = datetime.now()
+        if self.delivery_date is None or self.po_received_date is None:
+            now = datetime.now()
+            if self.delivery_date is None:
+                self.delivery_date = now + timedelta(days=21)
+            if self.po_received_date is None:
+                self.po_received_date = now
 
 
-@dataclass
+@dataclass(slots=True)
 class MovementLine:
     """Single line item for a stock movement"""
     item_code: str  # Internal item code from DB
@@ -65,7 +182,7 @@ class MovementLine:
     use_wip: bool = False  # True for fail-if-insufficient-wip
 
 
-@dataclass
+@dataclass(slots=True)
 class StockMovement:
     """Stock movement order (pull from inventory)"""
     po_number: str  # Original PO number
@@ -76,30 +193,20 @@ class StockMovement:
     crif_date: Optional[datetime] = None
 
     def __post_init__(self):
-        if self.delivery_date is None:
-            self.delivery_date = datetime.now()
-        if self.po_received_date is None:
-            self.po_received_date = datetime.now()
-        if self.crif_date is None:
-            self.crif_date = datetime.now()
-
+        if self.delivery_date is None or self.po_received_date is None or self.crif_date is None:
+            now = datetime.now()
+            if self.delivery_date is None:
+                self.delivery_date = now
+            if self.po_received_date is None:
+                self.po_received_date = now
+            if self.crif_date is None:
+                self.crif_date = now
 
-def _prettify_xml(elem: ET.Element) -> str:
-    """Return a pretty-printed XML string with proper formatting"""
-    rough_string = ET.tostring(elem, encoding='unicode')
-    reparsed = minidom.parseString(rough_string)
 
-    # Get pretty printed version
-    pretty = reparsed.toprettyxml(indent="   ")
-
-    # Remove extra blank lines and fix formatting
-    lines = []
-    for line in pretty.split('\n'):
-        stripped = line.rstrip()
-        if stripped:  # Skip empty lines
-            lines.append(stripped)
-
-    return '\n'.join(lines)
+@lru_cache(maxsize=4096)
+def _xe(value) -> str:
+    """Escape a value for XML text/attributes (part numbers repeat, so cache them)"""
+    return escape(str(value), {'"': '&quot;'})
 
 
 def _format_date_short(dt: datetime) -> str:
@@ -109,7 +216,25 @@ def _format_date_short(dt: datetime) -> str:
 
 def _format_date_long(dt: datetime) -> str:
     """Format date as MM/DD/YYYY"""
-    return dt.strftime("%m/%d/%Y")
+    return f"{dt.month:02d}/{dt.day:02d}/{dt.year}"
+
+
+def _suffix_index(suffix: str) -> int:
+    """Position of a stock file suffix in the sequence a..z, aa..az, ba.. (a = 0)"""
+    index = 0
+    for ch in suffix:
+        index = index * 26 + (ord(ch) - 96)
+    return index - 1
+
+
+def _suffix_from_index(index: int) -> str:
+    """Inverse of _suffix_index: 0 -> 'a', 25 -> 'z', 26 -> 'aa'"""
+    letters = []
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters.append(chr(97 + rem))
+    return ''.join(reversed(letters))
 
 
 def generate_stock_job_xml(
@@ -129,80 +254,64 @@ def generate_stock_job_xml(
         Tuple of (filepath, order_count)
     """
     now = datetime.now()
-    date_str = now.strftime("%m%d%y")
+    date_str = f"{now.month:02d}{now.day:02d}{now.year % 100:02d}"
+    po_date = f"{now.month:02d}.{now.day:02d}.{now.year % 100:02d}"
 
     # Find next available filename
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
-
-    suffix = 'a'
-    while True:
-        filename = f"sw-stock-{date_str}{suffix}.xml"
-        filepath = output_path / filename
-        if not filepath.exists():
-            break
-        suffix = chr(ord(suffix) + 1)
-        if suffix > 'z':
-            suffix = 'aa'
-
-    # Build XML
-    lines = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        f'<!DOCTYPE orders SYSTEM "{DTD_URL}">',
-        '',
-        '<!--Generated from customer order entry -->',
-        '',
-        '<orders>'
+    os.makedirs(output_dir, exist_ok=True)
+
+    # One directory scan instead of an exists() check per candidate name
+    prefix = f"sw-stock-{date_str}"
+    suffixes = [
+        entry.name[len(prefix):-4] for entry in os.scandir(output_dir)
+        if entry.name.startswith(prefix) and entry.name.endswith('.xml')
     ]
+    suffix = _suffix_from_index(max(
+        (_suffix_index(s) for s in suffixes if s.isascii() and s.isalpha() and s.islower()),
+        default=-1
+    ) + 1)
+    filepath = os.path.join(output_dir, f"{prefix}{suffix}.xml")
 
     po_sequence = sequence_start
     order_count = 0
 
-    for job in jobs:
-        for line in job.lines:
-            po_num = f"VMI {now.strftime('%m.%d.%y')} {po_sequence}"
-            delivery_date = _format_date_short(job.delivery_date)
-            po_received = _format_date_long(job.po_received_date)
-            crif = _format_date_short(job.delivery_date)
-
-            # Match exact schema from sample: address before code in order-customer
-            order_xml = f'''<order signal="submit" plant="{PLANT}">
-   <header>
-      <order-customer address="{BASE_ADDRESS}" code="{CUSTOMER_CODE}">
-         <po>{po_num}</po>
-      </order-customer>
-      <invoice-customer address="{BASE_ADDRESS}"/>
-      <delivery-customer address="{job.delivery_address}" date="{delivery_date}">
-         <delivery-method code="{DELIVERY_METHOD}">
-            <freight>
-               <prepaid />
-            </freight>
-         </delivery-method>
-      </delivery-customer>
-    <request-options po-received="{po_received}" crif="{crif}" crif-ship="{crif}" />
-   </header>
-   <lines>
-      <line quantity="{line.quantity_rounded}" run-type="normal">
-         <option>
-          <book-stock-job price="{line.price:.2f}" price-qty="{line.price_qty}" />
-         </option>
-         <item>
-            <customer-reference-number>{line.part_number}</customer-reference-number>
-         </item>
-      </line>
-   </lines>
-</order>'''
-            lines.append(order_xml)
-            po_sequence += 1
-            order_count += 1
-
-    lines.append('</orders>')
+    # Write each order as it's built instead of joining the whole document in memory.
+    # Kept single-process: rendering is ~2us per order, far less than the cost of
+    # starting worker processes (spawned, on Windows) for any realistic batch.
+    with open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(_STOCK_PROLOGUE)
 
-    # Write file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lines))
+        (frag_po, frag_address, frag_date, frag_received, frag_crif, frag_crif_ship,
+         frag_quantity, frag_price, frag_price_qty, frag_part, frag_end) = _STOCK_FRAGS
+        write = f.write
 
-    return str(filepath), order_count
+        for job in jobs:
+            # Everything from </po> to quantity=" is the same for every line of the job
+            delivery_date = _format_date_short(job.delivery_date)
+            job_header = ''.join((
+                frag_address, _xe(job.delivery_address),
+                frag_date, delivery_date,
+                frag_received, _format_date_long(job.po_received_date),
+                frag_crif, delivery_date,
+                frag_crif_ship, delivery_date,
+                frag_quantity,
+            ))
+
+            for line in job.lines:
+                write(''.join((
+                    frag_po, f"VMI {po_date} {po_sequence}",
+                    job_header, str(line.quantity_rounded),
+                    frag_price, f"{line.price:.2f}",
+                    frag_price_qty, str(line.price_qty),
+                    frag_part, _xe(line.part_number),
+                    frag_end,
+                )).encode())
+                po_sequence += 1
+                order_count += 1
+
+        f.write(_EPILOGUE)
+
+    return filepath, order_count
 
 
 def generate_movement_xml(
@@ -220,85 +329,60 @@ def generate_movement_xml(
         Tuple of (filepath, order_count)
     """
     now = datetime.now()
-    date_str = now.strftime("%m%d%y")
-    time_str = now.strftime("%H%M%S")
+    date_str = f"{now.month:02d}{now.day:02d}{now.year % 100:02d}"
+    time_str = f"{now.hour:02d}{now.minute:02d}{now.second:02d}"
 
     # Find next available filename
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
-
-    seq = 1
-    while True:
-        filename = f"GT-Movement-{date_str}-{time_str}-{seq:03d}.xml"
-        filepath = output_path / filename
-        if not filepath.exists():
-            break
-        seq += 1
-
-    # Build XML
-    lines = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        f'<!DOCTYPE orders SYSTEM "{DTD_URL}">',
-        '',
-        '<!--Generated from S-W Order Entry Interface -->',
-        '',
-        '<orders>'
+    os.makedirs(output_dir, exist_ok=True)
+
+    # One directory scan instead of an exists() check per candidate name
+    prefix = f"GT-Movement-{date_str}-{time_str}-"
+    seqs = [
+        entry.name[len(prefix):-4] for entry in os.scandir(output_dir)
+        if entry.name.startswith(prefix) and entry.name.endswith('.xml')
     ]
+    seq = max((int(s) for s in seqs if s.isdigit()), default=0) + 1
+    filepath = os.path.join(output_dir, f"{prefix}{seq:03d}.xml")
 
     order_count = 0
 
-    for movement in movements:
-        ro_sequence = 1
-
-        for line in movement.lines:
-            delivery_date = _format_date_long(movement.delivery_date)
-            po_received = _format_date_long(movement.po_received_date)
-            crif = _format_date_long(movement.crif_date)
-
-            # Choose option type based on WIP flag
-            if line.use_wip:
-                option_tag = f'<fail-if-insufficient-wip job-number="{line.job_number}" price="{int(line.price)}" price-qty="{line.price_qty}" />'
-            else:
-                option_tag = f'<fail-if-insufficient-stock job-number="{line.job_number}" price="{int(line.price)}" price-qty="{line.price_qty}" />'
-
-            order_xml = f'''<order signal="submit" plant="{PLANT}">
-  <header>
-    <order-customer code="{CUSTOMER_CODE}" address="{BASE_ADDRESS}">
-      <po>{movement.po_number}</po>
-      <ro>{ro_sequence:03d}</ro>
-    </order-customer>
-    <invoice-customer code="{CUSTOMER_CODE}" address="{BASE_ADDRESS}"></invoice-customer>
-    <delivery-customer code="{CUSTOMER_CODE}" address="{movement.delivery_address}" date="{delivery_date}">
-      <delivery-method code="{DELIVERY_METHOD}">
-        <freight>
-           <collect />
-        </freight>
-      </delivery-method>
-    </delivery-customer>
-    <request-options po-received="{po_received}" crif="{crif}" />
-  </header>
-  <lines>
-    <line quantity="{line.quantity}" run-type="normal">
-       <option>
-          {option_tag}
-       </option>
-    <item>
-      <item-code>{line.item_code}</item-code>
-    </item>
-    </line>
-  </lines>
-</order>'''
-            lines.append(order_xml)
-            ro_sequence += 1
-            order_count += 1
-
-    lines.append('</orders>')
-
-    # Write file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lines))
-
-    return str(filepath), order_count
+    # Write each order as it's built instead of joining the whole document in memory
+    with open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(_MOVEMENT_PROLOGUE)
+
+        (frag_po, frag_ro, frag_address, frag_date, frag_received, frag_crif,
+         frag_quantity, frag_option, frag_job, frag_price, frag_price_qty,
+         frag_item, frag_end) = _MOVEMENT_FRAGS
+        write = f.write
+
+        for movement in movements:
+            # Everything except ro and the line fields is the same for every line
+            order_head = ''.join((frag_po, _xe(movement.po_number), frag_ro))
+            order_header = ''.join((
+                frag_address, _xe(movement.delivery_address),
+                frag_date, _format_date_long(movement.delivery_date),
+                frag_received, _format_date_long(movement.po_received_date),
+                frag_crif, _format_date_long(movement.crif_date),
+                frag_quantity,
+            ))
+
+            for ro_sequence, line in enumerate(movement.lines, 1):
+                write(''.join((
+                    order_head, f"{ro_sequence:03d}",
+                    order_header, str(line.quantity),
+                    # Choose option type based on WIP flag
+                    frag_option, 'wip' if line.use_wip else 'stock',
+                    frag_job, _xe(line.job_number),
+                    frag_price, str(int(line.price)),
+                    frag_price_qty, str(line.price_qty),
+                    frag_item, _xe(line.item_code),
+                    frag_end,
+                )).encode())
+                order_count += 1
+
+        f.write(_EPILOGUE)
+
+    return filepath, order_count
 
 
 class XMLGeneratorService:
@@ -354,13 +438,10 @@ class XMLGeneratorService:
         self._stock_job_sequence = start
 
 
-# Singleton instance
-_xml_generator = None
+# Singleton instance - construction is cheap and side-effect free, so build it at import
+_xml_generator = XMLGeneratorService()
 
 
 def get_xml_generator() -> XMLGeneratorService:
     """Get the singleton XML generator service"""
-    global _xml_generator
-    if _xml_generator is None:
-        _xml_generator = XMLGeneratorService()
     return _xml_generator
@@ -7,7 +7,6 @@ Includes scheduler for daily processing with retry logic
 import os
 import sys
 import threading
-import time
 from datetime import datetime, timedelta
 import webbrowser
 
@@ -18,12 +17,16 @@ from app.main import app, process_hot_folder, check_retry_needed, execute_retry
 from app.services.logger import get_logger
 from app.services.config import get_config
 
+# Longest the scheduler sleeps between checks, so a scheduler time changed in
+# the UI is picked up without waiting for the previously computed fire time
+SCHEDULER_MAX_WAIT = 300  # seconds
+
 
 class DailyScheduler:
     """Scheduler for daily tasks with retry logic"""
 
     def __init__(self):
-        self.running = False
+        self._stop = threading.Event()
         self.thread = None
         self.last_run_date = None
         self.retry_scheduled_time = None
@@ -33,9 +36,10 @@ class DailyScheduler:
         config = get_config().config
         return config.scheduler_hour, config.scheduler_minute
 
-    def _get_next_run_time(self):
-        """Calculate next run time based on config"""
-        hour, minute = self._get_config_time()
+    def _get_next_run_time(self, hour=None, minute=None):
+        """Calculate next run time based on config (or the given hour/minute)"""
+        if hour is None:
+            hour, minute = self._get_config_time()
         now = datetime.now()
         target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
 
@@ -51,7 +55,7 @@ class DailyScheduler:
         hour, minute = self._get_config_time()
         logger.log_user_action("Scheduler started", f"Daily run at {hour:02d}:{minute:02d}")
 
-        while self.running:
+        while not self._stop.is_set():
             now = datetime.now()
             today = now.date()
             hour, minute = self._get_config_time()
@@ -91,15 +95,20 @@ class DailyScheduler:
                     print(f"[SCHEDULER] Retry error: {e}")
                     self.retry_scheduled_time = None
 
-            # Sleep for 30 seconds before checking again
-            time.sleep(30)
+            # Sleep until the next daily run or retry is due (or stop() is called)
+            next_fire = self._get_next_run_time(hour, minute)
+            if self.retry_scheduled_time:
+                next_fire = min(next_fire, self.retry_scheduled_time)
+            delay = (next_fire - datetime.now()).total_seconds()
+            if self._stop.wait(min(max(delay, 0), SCHEDULER_MAX_WAIT)):
+                break
 
     def start(self):
         """Start the scheduler in a background thread"""
-        if self.running:
+        if self.thread and self.thread.is_alive():
             return
 
-        self.running = True
+        self._stop.clear()
         self.thread = threading.Thread(target=self._scheduler_loop, daemon=True)
         self.thread.start()
 
@@ -108,17 +117,11 @@ class DailyScheduler:
 
     def stop(self):
         """Stop the scheduler"""
-        self.running = False
+        self._stop.set()
         if self.thread:
             self.thread.join(timeout=5)
 
 
-def open_browser():
-    """Open browser after short delay"""
-    time.sleep(1.5)
-    webbrowser.open('http://127.0.0.1:5000')
-
-
 if __name__ == '__main__':
     config = get_config().config
 
@@ -138,8 +141,10 @@ if __name__ == '__main__':
     scheduler = DailyScheduler()
     scheduler.start()
 
-    # Open browser automatically
-    threading.Thread(target=open_browser, daemon=True).start()
+    # Open browser automatically once Flask has had a moment to start listening
+    browser_timer = threading.Timer(1.5, webbrowser.open, args=('http://127.0.0.1:5000',))
+    browser_timer.daemon = True
+    browser_timer.start()
 
     try:
         # Run Flask - localhost only (127.0.0.1), not network accessible
@@ -0,0 +1,61 @@
+"""Tests for SQL query log sampling in the activity logger"""
+
+import csv
+import tempfile
+import unittest
+
+from app.services.config import AppConfig
+from app.services.logger import ActivityLogger
+
+
+def _run_queries(logger: ActivityLogger, count: int):
+    """Log successful queries the way SQLService does (sampled)"""
+    for i in range(count):
+        if logger.should_log_sql_query():
+            logger.log_sql_query(query=f"SELECT {i}", execution_time=0.01, row_count=1)
+
+
+def _sql_rows(logger: ActivityLogger):
+    with open(logger._get_log_file(), newline='', encoding='utf-8') as f:
+        return [row for row in csv.DictReader(f) if row['Type'] == 'SQL']
+
+
+class SQLLogSamplingTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.log_dir = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_sql_log_every_loaded_from_config(self):
+        config = AppConfig.from_dict({'sql_log_every': 5})
+        self.assertEqual(config.sql_log_every, 5)
+        self.assertEqual(AppConfig.from_dict({}).sql_log_every, 1)
+
+    def test_configured_n_skips_entries(self):
+        config = AppConfig.from_dict({'sql_log_every': 3})
+        logger = ActivityLogger(self.log_dir, sql_log_every=config.sql_log_every)
+        _run_queries(logger, 9)
+
+        self.assertEqual(len(_sql_rows(logger)), 3)
+        self.assertEqual(len(logger._entries_cache), 3)
+
+    def test_zero_logs_errors_only(self):
+        logger = ActivityLogger(self.log_dir, sql_log_every=0)
+        _run_queries(logger, 5)
+        logger.log_sql_query(query="SELECT bad", execution_time=0.0, row_count=0, error="boom")
+
+        rows = _sql_rows(logger)
+        self.assertEqual(len(rows), 1)
+        self.assertIn("Error: boom", rows[0]['Details'])
+
+    def test_default_logs_every_query(self):
+        logger = ActivityLogger(self.log_dir)
+        _run_queries(logger, 4)
+        self.assertEqual(len(_sql_rows(logger)), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""Tests for the SQL service result cache"""
+
+import queue
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from app.services import config as config_module
+from app.services.sql_service import SQLService
+
+
+class ResultCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        # Keep the config singleton away from the real config/settings.json
+        self._tmp = tempfile.TemporaryDirectory()
+        config_dir = Path(self._tmp.name)
+        for patcher in (
+            mock.patch.object(config_module, 'CONFIG_DIR', config_dir),
+            mock.patch.object(config_module, 'CONFIG_FILE', config_dir / 'settings.json'),
+            mock.patch.object(config_module.ConfigService, '_instance', None),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(self._tmp.cleanup)
+
+        self.service = SQLService()
+        self.service._pool = queue.LifoQueue()  # Results are only cached while connected
+        self.executed = 0
+
+        def execute(query_type, params, row_factory=None, single=False):
+            self.executed += 1
+            return [{'quantity': 3}, {'quantity': 1}, {'quantity': 2}]
+
+        self.service._execute_prepared = execute
+        self.service._execute_many = lambda queries: [execute(qt, params) for qt, params, _ in queries]
+        self.params = {'part_number': 'P1', 'site': '14'}
+
+    def test_mutating_result_does_not_change_cached_execute(self):
+        first = self.service._cached_execute('fg_inventory', self.params)
+        first.sort(key=lambda row: row['quantity'])
+        first.append({'quantity': 99})
+
+        second = self.service._cached_execute('fg_inventory', self.params)
+        second.pop()
+
+        third = self.service._cached_execute('fg_inventory', self.params)
+        self.assertEqual(self.executed, 1)
+        self.assertEqual(third, [{'quantity': 3}, {'quantity': 1}, {'quantity': 2}])
+
+    def test_mutating_result_does_not_change_cached_execute_many(self):
+        queries = [('fg_inventory', self.params, None), ('wip_inventory', self.params, None)]
+        first = self.service._cached_execute_many(queries)
+        first[0].clear()
+        first[1].append({'quantity': 99})
+
+        second = self.service._cached_execute_many(queries)
+        self.assertEqual(self.executed, 2)
+        self.assertEqual(second, [[{'quantity': 3}, {'quantity': 1}, {'quantity': 2}]] * 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+"""
+Tests that generated XML matches the committed reference files in outputs/.
+
+The reference files are what the order-entry import has always received.
+Their orders are rebuilt as StockJob / StockMovement objects, regenerated,
+and compared byte for byte (line endings included).
+"""
+
+import re
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+from app.services import xml_generator
+from app.services.xml_generator import (
+    StockJob, StockJobLine, StockMovement, MovementLine,
+    generate_stock_job_xml, generate_movement_xml
+)
+
+SAMPLES_DIR = Path(__file__).parent.parent / "outputs"
+STOCK_SAMPLE = SAMPLES_DIR / "sw-stock-010626a.xml"
+MOVEMENT_SAMPLE = SAMPLES_DIR / "GT-Movement-010626-093023-001.xml"
+
+_STOCK_ORDER_RE = re.compile(
+    r'<po>VMI [\d.]+ \d+</po>.*?'
+    r'<delivery-customer address="(?P<address>[^"]*)" date="(?P<date>[^"]*)">.*?'
+    r'po-received="(?P<received>[^"]*)".*?'
+    r'<line quantity="(?P<quantity>\d+)".*?'
+    r'price="(?P<price>[^"]*)" price-qty="(?P<price_qty>\d+)".*?'
+    r'<customer-reference-number>(?P<part>[^<]*)</customer-reference-number>',
+    re.S
+)
+_MOVEMENT_ORDER_RE = re.compile(
+    r'<po>(?P<po>[^<]*)</po>\s*<ro>\d+</ro>.*?'
+    r'<delivery-customer code="[^"]*" address="(?P<address>[^"]*)" date="(?P<date>[^"]*)">.*?'
+    r'po-received="(?P<received>[^"]*)" crif="(?P<crif>[^"]*)".*?'
+    r'<line quantity="(?P<quantity>\d+)".*?'
+    r'<fail-if-insufficient-(?P<option>wip|stock) job-number="(?P<job>[^"]*)" '
+    r'price="(?P<price>\d+)" price-qty="(?P<price_qty>\d+)".*?'
+    r'<item-code>(?P<item>[^<]*)</item-code>',
+    re.S
+)
+
+
+def _parse_date(value: str) -> datetime:
+    return datetime.strptime(value, "%m/%d/%Y")
+
+
+def _strip_trailing_spaces(data: bytes) -> bytes:
+    """The reference files carry stray spaces at some line ends; the generator never emits them"""
+    return re.sub(rb'[ \t]+\r\n', b'\r\n', data)
+
+
+def _blank_release_fields(data: bytes) -> bytes:
+    """
+    Blank the per-line ERP release values in movement XML.
+
+    The reference file carries each PO line's own release number and dates;
+    StockMovement holds one set of dates per PO and numbers ro from 001.
+    """
+    data = re.sub(rb'\b(date|po-received|crif)="[^"]*"', rb'\1=""', data)
+    return re.sub(rb'<ro>\d+</ro>', b'<ro></ro>', data)
+
+
+class _FixedDatetime(datetime):
+    now_value = None
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.now_value
+
+
+class XMLOutputMatchesSamplesTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.output_dir = self._tmp.name
+
+    def _generate_at(self, now: datetime, generate, *args):
+        _FixedDatetime.now_value = now
+        with mock.patch.object(xml_generator, 'datetime', _FixedDatetime):
+            return generate(*args)
+
+    def test_stock_jobs_match_sample(self):
+        sample = STOCK_SAMPLE.read_bytes()
+        jobs = []
+        for order in _STOCK_ORDER_RE.finditer(sample.decode('utf-8')):
+            key = (order['address'], order['date'], order['received'])
+            if not jobs or jobs[-1][0] != key:
+                jobs.append((key, StockJob(
+                    lines=[],
+                    delivery_address=order['address'],
+                    delivery_date=_parse_date(order['date']),
+                    po_received_date=_parse_date(order['received'])
+                )))
+            line = StockJobLine(part_number=order['part'], quantity=int(order['quantity']),
+                                price=float(order['price']), price_qty=int(order['price_qty']))
+            # The sample predates rounding to 500s - reproduce its quantities as written
+            line.quantity_rounded = int(order['quantity'])
+            jobs[-1][1].lines.append(line)
+        jobs = [job for _, job in jobs]
+
+        filepath, count = self._generate_at(
+            datetime(2026, 1, 6, 9, 0, 0), generate_stock_job_xml, jobs, self.output_dir, 101
+        )
+
+        self.assertEqual(Path(filepath).name, STOCK_SAMPLE.name)
+        self.assertEqual(count, sample.count(b'<order '))
+        # The legacy interface dropped the trailing zero on a few prices (e.g. 1154.7)
+        expected = re.sub(rb'price="(\d+\.\d)"', rb'price="\g<1>0"', _strip_trailing_spaces(sample))
+        self.assertEqual(Path(filepath).read_bytes(), expected)
+
+    def test_movements_match_sample(self):
+        sample = MOVEMENT_SAMPLE.read_bytes()
+        movements = []
+        for order in _MOVEMENT_ORDER_RE.finditer(sample.decode('utf-8')):
+            if not movements or movements[-1].po_number != order['po']:
+                movements.append(StockMovement(
+                    po_number=order['po'],
+                    lines=[],
+                    delivery_address=order['address'],
+                    delivery_date=_parse_date(order['date']),
+                    po_received_date=_parse_date(order['received']),
+                    crif_date=_parse_date(order['crif'])
+                ))
+            movements[-1].lines.append(MovementLine(
+                item_code=order['item'], job_number=order['job'], quantity=int(order['quantity']),
+                price=float(order['price']), price_qty=int(order['price_qty']),
+                use_wip=order['option'] == 'wip'
+            ))
+
+        filepath, count = self._generate_at(
+            datetime(2026, 1, 6, 9, 30, 23), generate_movement_xml, movements, self.output_dir
+        )
+
+        self.assertEqual(Path(filepath).name, MOVEMENT_SAMPLE.name)
+        self.assertEqual(count, sample.count(b'<order '))
+        self.assertEqual(_blank_release_fields(Path(filepath).read_bytes()),
+                         _blank_release_fields(_strip_trailing_spaces(sample)))
+
+    def test_output_uses_crlf_line_endings(self):
+        job = StockJob(lines=[StockJobLine(part_number='P1', quantity=1000)])
+        filepath, _ = generate_stock_job_xml([job], self.output_dir)
+        data = Path(filepath).read_bytes()
+        self.assertEqual(data.count(b'\n'), data.count(b'\r\n'))
+        self.assertTrue(data.startswith(b'<?xml version="1.0" encoding="UTF-8"?>\r\n'))
+
+
+if __name__ == '__main__':
+    unittest.main()